@@ -1,51 +1,57 @@
-def my_function():
-  print("Hello from a function")
+def _demo_basic():
+  def my_function():
+    print("Hello from a function")
 
-my_function()
+  my_function()
 
 
 #####
-def my_function(fname):
-  print(fname + " Refsnes")
+def _demo_one_argument():
+  def my_function(fname):
+    print(fname + " Refsnes")
 
-my_function("Emil")
-my_function("Tobias")
-my_function("Linus")
+  my_function("Emil")
+  my_function("Tobias")
+  my_function("Linus")
 
 
 ######
-def my_function(fname, lname):
-  print(fname + " " + lname)
+def _demo_two_arguments():
+  def my_function(fname, lname):
+    print(fname + " " + lname)
 
-my_function("Emil", "Refsnes")
+  my_function("Emil", "Refsnes")
 
 
 ######
-def my_function(fname, lname):
-  print(fname + " " + lname)
+def _demo_missing_argument():
+  def my_function(fname, lname):
+    print(fname + " " + lname)
 
-my_function("Emil")
+  my_function("Emil")
 
 
 '''Arbitrary Arguments, *args
-If you do not know how many arguments that will be passed into your function, 
+If you do not know how many arguments that will be passed into your function,
 add a * before the parameter name in the function definition.
 
 This way the function will receive a tuple of arguments, and can access the items accordingly:'''
-def my_function(*kids):
-  print("The youngest child is " + kids[2])
+def _demo_args():
+  def my_function(*kids):
+    print("The youngest child is " + kids[2])
 
-my_function("Emil", "Tobias", "Linus")
+  my_function("Emil", "Tobias", "Linus")
 
 
 
 
 
 #Keyword Arguments
-def my_function(child3, child2, child1):
-  print("The youngest child is " + child3)
+def _demo_keyword_arguments():
+  def my_function(child3, child2, child1):
+    print("The youngest child is " + child3)
 
-my_function(child1 = "Emil", child2 = "Tobias", child3 = "Linus")
+  my_function(child1 = "Emil", child2 = "Tobias", child3 = "Linus")
 
 
 '''Arbitrary Keyword Arguments, **kwargs
@@ -55,41 +61,45 @@ This way the function will receive a dictionary of arguments, and can access the
 
 
 
-def my_function(**kid):
-  print("His last name is " + kid["lname"])
+def _demo_kwargs():
+  def my_function(**kid):
+    print("His last name is " + kid["lname"])
 
-my_function(fname = "Tobias", lname = "Refsnes")
+  my_function(fname = "Tobias", lname = "Refsnes")
 
 
 
 # Default Parameter Value
 
-def my_function(country = "Norway"):
-  print("I am from " + country)
+def _demo_default_value():
+  def my_function(country = "Norway"):
+    print("I am from " + country)
 
-my_function("Sweden")
-my_function("India")
-my_function()
-my_function("Brazil")
+  my_function("Sweden")
+  my_function("India")
+  my_function()
+  my_function("Brazil")
 
 #passing list
 
-def my_function(food):
-  for x in food:
-    print(x)
+def _demo_passing_list():
+  def my_function(food):
+    for x in food:
+      print(x)
 
-fruits = ["apple", "banana", "cherry"]
+  fruits = ["apple", "banana", "cherry"]
 
-my_function(fruits)
+  my_function(fruits)
 
 
 ##Return value
-def my_function(x):
-  return 5 * x
+def _demo_return_value():
+  def my_function(x):
+    return 5 * x
 
-print(my_function(3))
-print(my_function(5))
-print(my_function(9))
+  print(my_function(3))
+  print(my_function(5))
+  print(my_function(9))
 
 ##
 def myfunction():
@@ -97,14 +107,34 @@ def myfunction():
 
 
 # Recursion
-def tri_recursion(k):
-  if(k > 0):
-    result = k + tri_recursion(k - 1)
-    print(result)
-  else:
+# 1 + 2 + ... + k has the closed form k * (k + 1) // 2, so no recursion is
+# needed. show_steps prints every partial sum like the recursive version did.
+def tri_recursion(k, show_steps=False):
+  if k <= 0:
+    return 0
+  if show_steps:
     result = 0
-  return result
-
-print("Recursion Example Results:")
-tri_recursion(6)
-
+    for i in range(1, k + 1):
+      result += i
+      print(result)
+    return result
+  return k * (k + 1) // 2
+
+def _demo_recursion():
+  print("Recursion Example Results:")
+  tri_recursion(6, show_steps=True)
+
+
+# Importing this file only defines the examples; running it runs them in order
+if __name__ == "__main__":
+  _demo_basic()
+  _demo_one_argument()
+  _demo_two_arguments()
+  _demo_missing_argument()  # raises TypeError: lname is missing
+  _demo_args()
+  _demo_keyword_arguments()
+  _demo_kwargs()
+  _demo_default_value()
+  _demo_passing_list()
+  _demo_return_value()
+  _demo_recursion()
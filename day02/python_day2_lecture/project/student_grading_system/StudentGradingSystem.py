@@ -1,51 +1,66 @@
+import sys
+from array import array
+from bisect import bisect_right
+
+# Lowest marks needed for each grade above F, in ascending order
+GRADE_THRESHOLDS = (60, 70, 80, 90)
+GRADE_LETTERS = ("F", "C", "B", "A", "A+")
+
+
 # Function to calculate grade based on marks
 def calculate_grade(marks):
-    if marks >= 90:
-        return "A+"
-    elif marks >= 80:
-        return "A"
-    elif marks >= 70:
-        return "B"
-    elif marks >= 60:
-        return "C"
-    else:
-        return "F"
+    return GRADE_LETTERS[bisect_right(GRADE_THRESHOLDS, marks)]
 
 
-print("Welcome to Student Grading System!")
+# Function to calculate grades for a whole list of marks in one pass
+def grade_many(marks_list):
+    letters = GRADE_LETTERS
+    thresholds = GRADE_THRESHOLDS
+    return [letters[bisect_right(thresholds, marks)] for marks in marks_list]
+
 
-# List of Students (Dictionary for each student)
-students = []
+print("Welcome to Student Grading System!")
 
-# Input total students
-total_students = int(input("Enter number of students: "))
+# Student data is kept as parallel lists: names[i], marks_list[i] and
+# grades[i] all belong to the same student
+names = []
+marks_list = array("i")
 
-# For Loop to input student data
-for i in range(total_students):
-    print(f"\nEnter data for Student {i+1}")
-    name = input("Name: ")
-    marks = int(input("Marks (out of 100): "))
+if sys.stdin.isatty():
+    # Input total students
+    total_students = int(input("Enter number of students: "))
 
-    # Creating student dictionary
-    student = {
-        "name": name,
-        "marks": marks,
-        "grade": calculate_grade(marks)
-    }
+    # For Loop to input student data
+    for i in range(total_students):
+        print(f"\nEnter data for Student {i+1}")
+        names.append(input("Name: "))
+        marks_list.append(int(input("Marks (out of 100): ")))
+else:
+    # Input piped from a file: the count, then a name line and a marks
+    # line per student. Read it all at once instead of line by line.
+    data = sys.stdin.read().splitlines()
+    if not data:
+        sys.exit("Error: no input. Expected the number of students first.")
+    total_students = int(data[0])
+    if len(data) < 2 * total_students + 1:
+        sys.exit(f"Error: expected a name and marks line for each of "
+                 f"{total_students} students, but the input ends early.")
+    names = data[1:2 * total_students + 1:2]
+    marks_list = array("i", map(int, data[2:2 * total_students + 2:2]))
 
-    # Adding student to list
-    students.append(student)
+# Grade every student in one batch
+grades = grade_many(marks_list)
 
 print("\n--- Student Results ---")
-# While Loop to display all students
-index = 0
-while index < len(students):
-    student = students[index]
-    print(
-        f"Name: {student['name']}, Marks: {student['marks']}, Grade: {student['grade']}")
-    index += 1
+# Build every result line first, then display them with a single write
+lines = [
+    f"Name: {name}, Marks: {marks}, Grade: {grade}"
+    for name, marks, grade in zip(names, marks_list, grades)
+]
+if lines:
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # Using Set for unique grades
-unique_grades = set(student["grade"] for student in students)
+unique_grades = set(grades)
 
 print("\nUnique Grades in Class:", unique_grades)
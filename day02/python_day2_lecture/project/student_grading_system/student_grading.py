@@ -13,18 +13,54 @@ This is a practical example of using functions, loops, and data structures in Py
 
 # Import modules
 import os
+import re
+import sys
 import csv
 import datetime
-from statistics import mean
+from bisect import bisect_right
+from itertools import groupby
+from math import fsum
+from operator import itemgetter
 
 # Global variables
 # Dictionary to store student data: {student_id: {'name': name, 'grades': {subject: [grades]}}}
+# Student IDs and subject names are interned with sys.intern() as they come in,
+# since the same few strings are used as keys over and over.
 students = {}
 
+# "Available Students" listing, rendered on first use and reset to None
+# whenever students are added (see _render_roster)
+_roster_cache = None
+
+# Lowest score for each letter grade above F, in ascending order
+LETTER_GRADE_CUTOFFS = (60, 70, 80, 90)
+LETTER_GRADES = ("F", "D", "C", "B", "A")
+
+# Shape of a plain decimal number, checked before calling float() so that
+# obviously bad input is rejected without raising and catching ValueError
+GRADE_PATTERN = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+
+# Table row layouts for the reports. Rows are formatted into a list and
+# written with a single sys.stdout.write, so each layout ends in a newline.
+SUBJECT_ROW = "{:<15} {:<10.2f} {:<10.2f} {:<10.2f}\n"
+STUDENT_ROW = "{:<5} {:<15} {:<10.2f} {:<10}\n"
+STUDENT_ROW_NO_GRADES = "{:<5} {:<15} {:<10} {:<10}\n"
+
+# Write buffer for exported CSV files, so large exports hit the disk in few writes
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+# ANSI "erase screen, cursor to top-left" sequence, decided once at import.
+# Writing it is much cheaper than starting a cls/clear process on every menu.
+if os.name == 'nt':
+    os.system('')  # turns on ANSI escape handling in the Windows console
+CLEAR_SEQUENCE = '\033[2J\033[H' if sys.stdout.isatty() else ''
+
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR_SEQUENCE)
+    sys.stdout.flush()
 
 
 def display_header(title):
@@ -53,32 +89,84 @@ def get_valid_input(prompt, validation_func, error_message):
         print(error_message)
 
 
+def calculate_average(grades):
+    """Calculate the average of a list of grades (0 for an empty list)."""
+    if not grades:
+        return 0
+    # fsum keeps the sum accurate without statistics.mean's per-value
+    # Fraction conversion, which made every report slow on large classes
+    return fsum(grades) / len(grades)
+
+
+def _render_roster():
+    """Return the "Available Students" listing, rebuilding it only if stale."""
+    global _roster_cache
+    if _roster_cache is None:
+        _roster_cache = '\n'.join(f"ID: {student_id}, Name: {data['name']}"
+                                  for student_id, data in students.items())
+    return _roster_cache
+
+
+def compute_student_totals():
+    """
+    Sum every student's grades in one pass over the class.
+
+    Returns:
+        Dictionary {student_id: (total, count)} for students with grades
+    """
+    totals = {}
+    for student_id, data in students.items():
+        total = 0.0
+        count = 0
+        for subject_grades in data['grades'].values():
+            total += fsum(subject_grades)
+            count += len(subject_grades)
+        if count:
+            totals[student_id] = (total, count)
+    return totals
+
+
+def compute_student_averages():
+    """Return {student_id: overall average} for students with grades."""
+    return {student_id: total / count
+            for student_id, (total, count) in compute_student_totals().items()}
+
+
+def compute_subject_averages(subject):
+    """Return {student_id: average in subject} for students graded in it."""
+    averages = {}
+    for student_id, data in students.items():
+        subject_grades = data['grades'].get(subject)
+        if subject_grades:
+            averages[student_id] = calculate_average(subject_grades)
+    return averages
+
+
 def is_valid_student_id(student_id):
     """Check if student ID is valid (non-empty string)."""
-    return bool(student_id.strip())
+    return bool(student_id) and not student_id.isspace()
 
 
 def is_valid_name(name):
     """Check if name is valid (non-empty string)."""
-    return bool(name.strip())
+    return bool(name) and not name.isspace()
 
 
 def is_valid_subject(subject):
     """Check if subject is valid (non-empty string)."""
-    return bool(subject.strip())
+    return bool(subject) and not subject.isspace()
 
 
 def is_valid_grade(grade):
     """Check if grade is valid (number between 0 and 100)."""
-    try:
-        grade_value = float(grade)
-        return 0 <= grade_value <= 100
-    except ValueError:
+    if not GRADE_PATTERN.fullmatch(grade):
         return False
+    return 0 <= float(grade) <= 100
 
 
 def add_student():
     """Add a new student to the system."""
+    global _roster_cache
     display_header("Add New Student")
 
     # Get student ID
@@ -96,10 +184,11 @@ def add_student():
                            is_valid_name, "Name cannot be empty.")
 
     # Add student to dictionary
-    students[student_id] = {
+    students[sys.intern(student_id)] = {
         'name': name,
         'grades': {}
     }
+    _roster_cache = None
 
     print(
         f"\nStudent '{name}' with ID '{student_id}' has been added successfully!")
@@ -117,8 +206,7 @@ def record_grade():
 
     # Display available students
     print("Available Students:")
-    for student_id, data in students.items():
-        print(f"ID: {student_id}, Name: {data['name']}")
+    print(_render_roster())
 
     # Get student ID
     while True:
@@ -130,19 +218,18 @@ def record_grade():
             break
 
     # Get subject
-    subject = get_valid_input(
-        "Enter subject: ", is_valid_subject, "Subject cannot be empty.")
+    subject = sys.intern(get_valid_input(
+        "Enter subject: ", is_valid_subject, "Subject cannot be empty."))
 
     # Initialize subject in grades dictionary if it doesn't exist
-    if subject not in students[student_id]['grades']:
-        students[student_id]['grades'][subject] = []
+    subject_grades = students[student_id]['grades'].setdefault(subject, [])
 
     # Get grade
     grade = float(get_valid_input("Enter grade (0-100): ",
                   is_valid_grade, "Grade must be a number between 0 and 100."))
 
     # Add grade to student's subject
-    students[student_id]['grades'][subject].append(grade)
+    subject_grades.append(grade)
 
     print(
         f"\nGrade {grade} for {subject} has been recorded for {students[student_id]['name']}.")
@@ -160,8 +247,7 @@ def view_student_grades():
 
     # Display available students
     print("Available Students:")
-    for student_id, data in students.items():
-        print(f"ID: {student_id}, Name: {data['name']}")
+    print(_render_roster())
 
     # Get student ID
     while True:
@@ -186,21 +272,24 @@ def view_student_grades():
         print("-" * 45)
 
         overall_grades = []
+        rows = []
+        row_format = SUBJECT_ROW.format
 
         for subject, subject_grades in grades.items():
             if subject_grades:
-                avg = mean(subject_grades)
+                avg = calculate_average(subject_grades)
                 highest = max(subject_grades)
                 lowest = min(subject_grades)
                 overall_grades.extend(subject_grades)
 
-                print("{:<15} {:<10.2f} {:<10.2f} {:<10.2f}".format(
-                    subject, avg, highest, lowest))
-                print(
-                    f"  All grades: {', '.join(str(g) for g in subject_grades)}")
+                rows.append(row_format(subject, avg, highest, lowest))
+                rows.append(
+                    f"  All grades: {', '.join(map(str, subject_grades))}\n")
+
+        sys.stdout.write(''.join(rows))
 
         if overall_grades:
-            overall_avg = mean(overall_grades)
+            overall_avg = calculate_average(overall_grades)
             print("\nOverall Average: {:.2f}".format(overall_avg))
             print("Letter Grade: {}".format(get_letter_grade(overall_avg)))
 
@@ -209,16 +298,14 @@ def view_student_grades():
 
 def get_letter_grade(score):
     """Convert a numerical score to a letter grade."""
-    if score >= 90:
-        return "A"
-    elif score >= 80:
-        return "B"
-    elif score >= 70:
-        return "C"
-    elif score >= 60:
-        return "D"
-    else:
-        return "F"
+    return LETTER_GRADES[bisect_right(LETTER_GRADE_CUTOFFS, score)]
+
+
+def get_letter_grades(scores):
+    """Convert a sequence of numerical scores to a list of letter grades."""
+    letters = LETTER_GRADES
+    cutoffs = LETTER_GRADE_CUTOFFS
+    return [letters[bisect_right(cutoffs, score)] for score in scores]
 
 
 def class_summary():
@@ -231,22 +318,14 @@ def class_summary():
         return
 
     # Calculate class statistics
-    all_grades = []
-    student_averages = {}
-
-    for student_id, data in students.items():
-        student_grades = []
-        for subject_grades in data['grades'].values():
-            student_grades.extend(subject_grades)
-
-        if student_grades:
-            avg = mean(student_grades)
-            student_averages[student_id] = avg
-            all_grades.extend(student_grades)
+    student_totals = compute_student_totals()
+    student_averages = {student_id: total / count
+                        for student_id, (total, count) in student_totals.items()}
 
     # Display class statistics
-    if all_grades:
-        class_avg = mean(all_grades)
+    if student_totals:
+        class_avg = (fsum(total for total, _ in student_totals.values())
+                     / sum(count for _, count in student_totals.values()))
         highest_avg = max(student_averages.values()) if student_averages else 0
         lowest_avg = min(student_averages.values()) if student_averages else 0
 
@@ -256,6 +335,10 @@ def class_summary():
         print(f"Highest Student Average: {highest_avg:.2f}")
         print(f"Lowest Student Average: {lowest_avg:.2f}")
 
+        # Letter grades are worked out once and shared by both tables below
+        letter_grades = dict(zip(student_averages,
+                                 get_letter_grades(student_averages.values())))
+
         # Find top performers
         print("\nTop Performers:")
         sorted_students = sorted(
@@ -264,7 +347,7 @@ def class_summary():
         for i, (student_id, avg) in enumerate(sorted_students[:3], 1):
             name = students[student_id]['name']
             print(
-                f"{i}. {name} (ID: {student_id}) - Average: {avg:.2f}, Grade: {get_letter_grade(avg)}")
+                f"{i}. {name} (ID: {student_id}) - Average: {avg:.2f}, Grade: {letter_grades[student_id]}")
 
         # Display all students
         print("\nAll Students:")
@@ -272,21 +355,19 @@ def class_summary():
             "ID", "Name", "Average", "Grade"))
         print("-" * 40)
 
+        rows = []
+        row_format = STUDENT_ROW.format
         for student_id, data in students.items():
             name = data['name']
-            student_grades = []
-
-            for subject_grades in data['grades'].values():
-                student_grades.extend(subject_grades)
 
-            if student_grades:
-                avg = mean(student_grades)
-                grade = get_letter_grade(avg)
-                print("{:<5} {:<15} {:<10.2f} {:<10}".format(
-                    student_id, name, avg, grade))
+            if student_id in student_averages:
+                rows.append(row_format(student_id, name,
+                                       student_averages[student_id],
+                                       letter_grades[student_id]))
             else:
-                print("{:<5} {:<15} {:<10} {:<10}".format(
+                rows.append(STUDENT_ROW_NO_GRADES.format(
                     student_id, name, "N/A", "N/A"))
+        sys.stdout.write(''.join(rows))
     else:
         print("No grades recorded yet for any student.")
 
@@ -325,16 +406,13 @@ def subject_summary():
         print(f"Subject '{subject_choice}' not found. Please try again.")
 
     # Collect grades for the chosen subject
-    subject_grades = {}
-    for student_id, data in students.items():
-        if subject_choice in data['grades'] and data['grades'][subject_choice]:
-            subject_grades[student_id] = mean(data['grades'][subject_choice])
+    subject_grades = compute_subject_averages(subject_choice)
 
     # Display subject statistics
     print(f"\nSummary for {subject_choice}:")
 
     if subject_grades:
-        subject_avg = mean(subject_grades.values())
+        subject_avg = calculate_average(list(subject_grades.values()))
         highest_avg = max(subject_grades.values())
         lowest_avg = min(subject_grades.values())
 
@@ -352,11 +430,13 @@ def subject_summary():
         sorted_students = sorted(
             subject_grades.items(), key=lambda x: x[1], reverse=True)
 
+        rows = []
+        row_format = STUDENT_ROW.format
         for student_id, avg in sorted_students:
             name = students[student_id]['name']
             grade = get_letter_grade(avg)
-            print("{:<5} {:<15} {:<10.2f} {:<10}".format(
-                student_id, name, avg, grade))
+            rows.append(row_format(student_id, name, avg, grade))
+        sys.stdout.write(''.join(rows))
     else:
         print(f"No grades recorded yet for {subject_choice}.")
 
@@ -377,45 +457,43 @@ def export_data():
 
     # Export student list
     students_filename = f"students_{timestamp}.csv"
-    with open(students_filename, 'w', newline='') as file:
+    with open(students_filename, 'w', newline='', buffering=EXPORT_BUFFER_SIZE) as file:
         writer = csv.writer(file)
         writer.writerow(["Student ID", "Name"])
-
-        for student_id, data in students.items():
-            writer.writerow([student_id, data['name']])
+        writer.writerows([student_id, data['name']]
+                         for student_id, data in students.items())
 
     # Export grades
     grades_filename = f"grades_{timestamp}.csv"
-    with open(grades_filename, 'w', newline='') as file:
+    with open(grades_filename, 'w', newline='', buffering=EXPORT_BUFFER_SIZE) as file:
         writer = csv.writer(file)
         writer.writerow(["Student ID", "Name", "Subject", "Grade"])
-
-        for student_id, data in students.items():
-            name = data['name']
-            for subject, grades in data['grades'].items():
-                for grade in grades:
-                    writer.writerow([student_id, name, subject, grade])
+        writer.writerows([student_id, data['name'], subject, grade]
+                         for student_id, data in students.items()
+                         for subject, grades in data['grades'].items()
+                         for grade in grades)
 
     # Export summary
     summary_filename = f"summary_{timestamp}.csv"
-    with open(summary_filename, 'w', newline='') as file:
+    with open(summary_filename, 'w', newline='', buffering=EXPORT_BUFFER_SIZE) as file:
         writer = csv.writer(file)
         writer.writerow(
             ["Student ID", "Name", "Overall Average", "Letter Grade"])
 
+        student_averages = compute_student_averages()
+        letter_grades = dict(zip(student_averages,
+                                 get_letter_grades(student_averages.values())))
+        rows = []
         for student_id, data in students.items():
             name = data['name']
-            all_grades = []
-
-            for subject_grades in data['grades'].values():
-                all_grades.extend(subject_grades)
 
-            if all_grades:
-                avg = mean(all_grades)
-                letter_grade = get_letter_grade(avg)
-                writer.writerow([student_id, name, f"{avg:.2f}", letter_grade])
+            if student_id in student_averages:
+                avg = student_averages[student_id]
+                rows.append([student_id, name, f"{avg:.2f}",
+                             letter_grades[student_id]])
             else:
-                writer.writerow([student_id, name, "N/A", "N/A"])
+                rows.append([student_id, name, "N/A", "N/A"])
+        writer.writerows(rows)
 
     print(f"Data exported successfully to the following files:")
     print(f"1. {students_filename} - Student list")
@@ -427,6 +505,7 @@ def export_data():
 
 def import_data():
     """Import student data from CSV files."""
+    global _roster_cache
     display_header("Import Data")
 
     # Get filename
@@ -446,30 +525,33 @@ def import_data():
                 # Importing student list
                 for row in reader:
                     if len(row) >= 2:
-                        student_id, name = row[0], row[1]
+                        student_id, name = sys.intern(row[0]), row[1]
                         if student_id not in students:
                             students[student_id] = {'name': name, 'grades': {}}
                 print("Student list imported successfully.")
 
             elif header == ["Student ID", "Name", "Subject", "Grade"]:
-                # Importing grades
-                for row in reader:
-                    if len(row) >= 4:
-                        student_id, name, subject, grade = row[0], row[1], row[2], row[3]
-
-                        # Add student if not exists
-                        if student_id not in students:
-                            students[student_id] = {'name': name, 'grades': {}}
-
-                        # Initialize subject if not exists
-                        if subject not in students[student_id]['grades']:
-                            students[student_id]['grades'][subject] = []
-
-                        # Add grade
+                # Importing grades. Exported files list each student's grades
+                # subject by subject, so consecutive rows are grouped and the
+                # student and subject are looked up once per group.
+                rows = (row for row in reader if len(row) >= 4)
+                for (student_id, subject), group in groupby(rows, key=itemgetter(0, 2)):
+                    student_id, subject = sys.intern(student_id), sys.intern(subject)
+                    group = list(group)
+
+                    # Add student if not exists
+                    if student_id not in students:
+                        students[student_id] = {'name': group[0][1], 'grades': {}}
+
+                    # Initialize subject if not exists
+                    subject_grades = students[student_id]['grades'].setdefault(
+                        subject, [])
+
+                    # Add grades
+                    for row in group:
+                        name, grade = row[1], row[3]
                         try:
-                            grade_value = float(grade)
-                            students[student_id]['grades'][subject].append(
-                                grade_value)
+                            subject_grades.append(float(grade))
                         except ValueError:
                             print(
                                 f"Invalid grade value '{grade}' for student {name}. Skipping.")
@@ -480,6 +562,9 @@ def import_data():
     except Exception as e:
         print(f"Error importing data: {e}")
 
+    # Students may have been added, even if the import failed part way
+    _roster_cache = None
+
     input("\nPress Enter to continue...")
 
 
@@ -525,6 +610,7 @@ def main_menu():
 
 def initialize_sample_data():
     """Initialize the system with sample data for demonstration."""
+    global _roster_cache
     # Add sample students
     students["S001"] = {
         'name': 'John Smith',
@@ -561,6 +647,7 @@ def initialize_sample_data():
             'English': [92, 95, 90]
         }
     }
+    _roster_cache = None
 
     print("Sample data initialized successfully!")
 
@@ -2,140 +2,228 @@
 Create PowerPoint presentation for Python OOP lecture
 """
 
+import copy
+import io
+import zipfile
+from pathlib import Path
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.text.text import Font
+from lxml import etree
+
+# Shared formatting objects, built once instead of on every slide
+SLIDE_WIDTH = Inches(13.33)
+SLIDE_HEIGHT = Inches(7.5)
+
+TITLE_COLOR = RGBColor(0, 112, 192)
+MAIN_TITLE_PT = Pt(44)
+SECTION_TITLE_PT = Pt(40)
+TITLE_PT = Pt(36)
+BODY_PT = Pt(24)
+
+CODE_LEFT = Inches(0.5)
+CODE_TOP = Inches(4)
+CODE_WIDTH = Inches(9)
+CODE_HEIGHT = Inches(2.5)
+CODE_PT = Pt(16)
+CODE_COLOR = RGBColor(0, 0, 128)
+CODE_BG_COLOR = RGBColor(240, 240, 240)
+
+def save_presentation(prs, path, compresslevel=1):
+    """Save the presentation to path with every part deflated at compresslevel."""
+    # python-pptx always deflates at zlib's default level, so serialize into
+    # memory, re-zip the parts at the chosen level, and write the file once
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    output = io.BytesIO()
+    with zipfile.ZipFile(buffer) as package, zipfile.ZipFile(output, 'w') as repacked:
+        for info in package.infolist():
+            repacked.writestr(info, package.read(info), zipfile.ZIP_DEFLATED, compresslevel)
+    Path(path).write_bytes(output.getvalue())
+
+# Styled code box <p:sp> element, built on the first code slide and copied after
+_code_box_template = None
 
-def add_title_slide(prs, title, subtitle):
+def set_default_font(text_frame, size, levels=1, name=None, color=None):
+    """Set the font every paragraph in a text frame inherits, per outline level."""
+    lstStyle = text_frame._txBody.find(qn('a:lstStyle'))
+    for level in range(1, levels + 1):
+        lvl_pPr = lstStyle.find(qn(f'a:lvl{level}pPr'))
+        if lvl_pPr is None:
+            lvl_pPr = etree.SubElement(lstStyle, qn(f'a:lvl{level}pPr'))
+        defRPr = lvl_pPr.find(qn('a:defRPr'))
+        if defRPr is None:
+            defRPr = etree.SubElement(lvl_pPr, qn('a:defRPr'))
+        
+        font = Font(defRPr)
+        font.size = size
+        if name is not None:
+            font.name = name
+        if color is not None:
+            font.color.rgb = color
+
+def add_code_box(slide, code):
+    """Add a gray, monospaced code box holding the given code to a slide."""
+    global _code_box_template
+    
+    if _code_box_template is None:
+        # First code box: style it through python-pptx and keep an empty copy
+        textbox = slide.shapes.add_textbox(CODE_LEFT, CODE_TOP, CODE_WIDTH, CODE_HEIGHT)
+        text_frame = textbox.text_frame
+        set_default_font(text_frame, CODE_PT, name='Courier New',
+                         color=CODE_COLOR)
+        text_frame.add_paragraph()
+        
+        # Add a light gray background to the code box
+        fill = textbox.fill
+        fill.solid()
+        fill.fore_color.rgb = CODE_BG_COLOR
+        
+        _code_box_template = copy.deepcopy(textbox._element)
+    else:
+        # Later code boxes: copy the styled template and give it a fresh id
+        sp = copy.deepcopy(_code_box_template)
+        shape_id = slide.shapes._next_shape_id
+        sp.nvSpPr.cNvPr.id = shape_id
+        sp.nvSpPr.cNvPr.name = f"TextBox {shape_id - 1}"
+        slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+        textbox = slide.shapes[-1]
+    
+    # Only the code text differs between code boxes
+    textbox.text_frame.paragraphs[1].text = code
+    return textbox
+
+def _format_title(title_shape, size):
+    """Make the first paragraph of a title bold, sized and in the title colour."""
+    font = title_shape.text_frame.paragraphs[0].font
+    font.size = size
+    font.bold = True
+    font.color.rgb = TITLE_COLOR
+
+def add_title_slide(prs, layout, title, subtitle):
     """Add a title slide with the given title and subtitle."""
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
-    slide.shapes.title.text = title
-    slide.placeholders[1].text = subtitle
+    slide = prs.slides.add_slide(layout)
+    # A new slide holds only its layout's title and body placeholders, in
+    # that order, so one pass over the placeholders finds both
+    title_shape, body_shape = slide.placeholders
+    title_shape.text = title
+    body_shape.text = subtitle
     
     # Format title
-    title_shape = slide.shapes.title
-    title_shape.text_frame.paragraphs[0].font.size = Pt(44)
-    title_shape.text_frame.paragraphs[0].font.bold = True
-    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 112, 192)
+    _format_title(title_shape, MAIN_TITLE_PT)
     
     return slide
 
-def add_section_slide(prs, title):
+def add_section_slide(prs, layout, title):
     """Add a section slide with the given title."""
-    slide = prs.slides.add_slide(prs.slide_layouts[2])
-    slide.shapes.title.text = title
+    slide = prs.slides.add_slide(layout)
+    title_shape = slide.shapes.title
+    title_shape.text = title
     
     # Format title
-    title_shape = slide.shapes.title
-    title_shape.text_frame.paragraphs[0].font.size = Pt(40)
-    title_shape.text_frame.paragraphs[0].font.bold = True
-    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 112, 192)
+    _format_title(title_shape, SECTION_TITLE_PT)
     
     return slide
 
-def add_content_slide(prs, title, content, code=None):
-    """Add a content slide with the given title, content, and optional code."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    slide.shapes.title.text = title
+def add_content_slide(prs, layout, title, content, code=None):
+    """Add a content slide with the given title, content, and optional code.
+    
+    content is a list of (text, level) pairs, see with_levels().
+    """
+    slide = prs.slides.add_slide(layout)
+    # A new slide holds only its layout's title and body placeholders, in
+    # that order, so one pass over the placeholders finds both
+    title_shape, body_shape = slide.placeholders
+    title_shape.text = title
     
     # Format title
-    title_shape = slide.shapes.title
-    title_shape.text_frame.paragraphs[0].font.size = Pt(36)
-    title_shape.text_frame.paragraphs[0].font.bold = True
-    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 112, 192)
+    _format_title(title_shape, TITLE_PT)
     
     # Add content
-    body_shape = slide.placeholders[1]
     text_frame = body_shape.text_frame
     text_frame.clear()
     
-    for line in content:
-        p = text_frame.add_paragraph()
-        p.text = line
-        p.font.size = Pt(24)
+    # Body text uses two levels, plain lines and "•" bullet lines, both 24pt
+    set_default_font(text_frame, BODY_PT, levels=2)
+    
+    # Build the <a:p> elements directly rather than going through
+    # add_paragraph() and the text, size and level setters once per line
+    txBody = text_frame._txBody
+    for line, level in content:
+        p = etree.SubElement(txBody, qn('a:p'))
+        if level:
+            etree.SubElement(p, qn('a:pPr'), lvl=str(level))
         
-        # Check if this is a bullet point
-        if line.startswith('•'):
-            p.level = 1
+        if line:
+            r = etree.SubElement(p, qn('a:r'))
+            etree.SubElement(r, qn('a:t')).text = line
     
     # Add code if provided
     if code:
-        left = Inches(0.5)
-        top = Inches(4)
-        width = Inches(9)
-        height = Inches(2.5)
-        
-        textbox = slide.shapes.add_textbox(left, top, width, height)
-        text_frame = textbox.text_frame
-        
-        p = text_frame.add_paragraph()
-        p.text = code
-        p.font.name = 'Courier New'
-        p.font.size = Pt(16)
-        p.font.color.rgb = RGBColor(0, 0, 128)
-        
-        # Add a light gray background to the code box
-        fill = textbox.fill
-        fill.solid()
-        fill.fore_color.rgb = RGBColor(240, 240, 240)
+        add_code_box(slide, code)
     
     return slide
 
-def create_presentation():
-    """Create the PowerPoint presentation for Python OOP lecture."""
-    prs = Presentation()
-    
-    # Set slide dimensions to 16:9 aspect ratio
-    prs.slide_width = Inches(13.33)
-    prs.slide_height = Inches(7.5)
-    
+def with_levels(lines):
+    """Pair each body line with its outline level: 1 for "•" bullets, else 0."""
+    return [(line, 1 if line.startswith('•') else 0) for line in lines]
+
+# Slide specs as (kind, title, body, code) tuples, in presentation order.
+# kind is "title" (body is the subtitle), "section" or "content".
+SLIDES = [
     # Title slide
-    add_title_slide(prs, 
-                   "Object-Oriented Programming in Python", 
-                   "Lambda Functions, Arrays, Classes, Objects, Inheritance, and Polymorphism")
-    
+    ("title",
+     "Object-Oriented Programming in Python",
+     "Lambda Functions, Arrays, Classes, Objects, Inheritance, and Polymorphism",
+     None),
+
     # Introduction slide
-    add_content_slide(prs, 
-                     "Introduction to OOP", 
-                     [
-                         "• Object-Oriented Programming (OOP) is a programming paradigm",
-                         "• Uses objects and classes to structure code",
-                         "• Makes complex code more manageable, reusable, and organized",
-                         "• Python supports multiple programming paradigms, including OOP",
-                         "",
-                         "Today we'll cover:",
-                         "• Lambda Functions",
-                         "• Arrays (Lists in Python)",
-                         "• Classes and Objects",
-                         "• Inheritance",
-                         "• Polymorphism"
-                     ])
-    
+    ("content",
+     "Introduction to OOP",
+     [
+         "• Object-Oriented Programming (OOP) is a programming paradigm",
+         "• Uses objects and classes to structure code",
+         "• Makes complex code more manageable, reusable, and organized",
+         "• Python supports multiple programming paradigms, including OOP",
+         "",
+         "Today we'll cover:",
+         "• Lambda Functions",
+         "• Arrays (Lists in Python)",
+         "• Classes and Objects",
+         "• Inheritance",
+         "• Polymorphism"
+     ],
+     None),
+
     # Lambda Functions section
-    add_section_slide(prs, "Lambda Functions")
-    
-    add_content_slide(prs, 
-                     "What are Lambda Functions?", 
-                     [
-                         "• Small, anonymous functions defined with the lambda keyword",
-                         "• Can take any number of arguments but only have one expression",
-                         "• Useful for short, simple functions that are used only once",
-                         "",
-                         "Syntax:",
-                         "lambda arguments: expression"
-                     ])
-    
-    add_content_slide(prs, 
-                     "Lambda Function Examples", 
-                     [
-                         "Example 1: Simple lambda function",
-                         "",
-                         "Example 2: Lambda with sorted()",
-                         "",
-                         "Example 3: Lambda with filter()"
-                     ],
-                     code="""# Example 1: Simple lambda function
+    ("section", "Lambda Functions", None, None),
+
+    ("content",
+     "What are Lambda Functions?",
+     [
+         "• Small, anonymous functions defined with the lambda keyword",
+         "• Can take any number of arguments but only have one expression",
+         "• Useful for short, simple functions that are used only once",
+         "",
+         "Syntax:",
+         "lambda arguments: expression"
+     ],
+     None),
+
+    ("content",
+     "Lambda Function Examples",
+     [
+         "Example 1: Simple lambda function",
+         "",
+         "Example 2: Lambda with sorted()",
+         "",
+         "Example 3: Lambda with filter()"
+     ],
+     """# Example 1: Simple lambda function
 add = lambda x, y: x + y
 print(add(5, 3))  # Output: 8
 
@@ -147,35 +235,36 @@ print(sorted_pairs)  # [(4, 'four'), (1, 'one'), (3, 'three'), (2, 'two')]
 # Example 3: Lambda with filter()
 numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
-print(even_numbers)  # [2, 4, 6, 8, 10]""")
-    
+print(even_numbers)  # [2, 4, 6, 8, 10]"""),
+
     # Arrays (Lists) section
-    add_section_slide(prs, "Arrays (Lists in Python)")
-    
-    add_content_slide(prs, 
-                     "Python Lists", 
-                     [
-                         "• In Python, we typically use lists as arrays",
-                         "• Lists are ordered, mutable collections",
-                         "• Can contain elements of different types",
-                         "• Dynamic sizing (no need to declare size in advance)",
-                         "",
-                         "Creating Lists:",
-                         "• Empty list: []",
-                         "• List with elements: [1, 2, 3]",
-                         "• Mixed types: [1, 'hello', 3.14, True]"
-                     ])
-    
-    add_content_slide(prs, 
-                     "List Operations", 
-                     [
-                         "• Accessing elements with indexing",
-                         "• Slicing to get portions of lists",
-                         "• Adding elements with append(), insert(), extend()",
-                         "• Removing elements with remove(), pop()",
-                         "• Other operations: len(), count(), sort(), reverse()"
-                     ],
-                     code="""# Accessing elements
+    ("section", "Arrays (Lists in Python)", None, None),
+
+    ("content",
+     "Python Lists",
+     [
+         "• In Python, we typically use lists as arrays",
+         "• Lists are ordered, mutable collections",
+         "• Can contain elements of different types",
+         "• Dynamic sizing (no need to declare size in advance)",
+         "",
+         "Creating Lists:",
+         "• Empty list: []",
+         "• List with elements: [1, 2, 3]",
+         "• Mixed types: [1, 'hello', 3.14, True]"
+     ],
+     None),
+
+    ("content",
+     "List Operations",
+     [
+         "• Accessing elements with indexing",
+         "• Slicing to get portions of lists",
+         "• Adding elements with append(), insert(), extend()",
+         "• Removing elements with remove(), pop()",
+         "• Other operations: len(), count(), sort(), reverse()"
+     ],
+     """# Accessing elements
 fruits = ["apple", "banana", "cherry", "date"]
 print(fruits[0])    # Output: apple
 print(fruits[-1])   # Output: date
@@ -190,19 +279,19 @@ print(fruits)  # ['apple', 'apricot', 'banana', 'cherry', 'date', 'elderberry']
 
 # Removing elements
 fruits.remove("banana")
-popped = fruits.pop(1)  # Removes and returns 'apricot'""")
-    
-    add_content_slide(prs, 
-                     "List Comprehensions", 
-                     [
-                         "• Concise way to create lists",
-                         "• More readable and often faster than loops",
-                         "• Can include conditions and nested loops",
-                         "",
-                         "Syntax:",
-                         "[expression for item in iterable if condition]"
-                     ],
-                     code="""# Create a list of squares
+popped = fruits.pop(1)  # Removes and returns 'apricot'"""),
+
+    ("content",
+     "List Comprehensions",
+     [
+         "• Concise way to create lists",
+         "• More readable and often faster than loops",
+         "• Can include conditions and nested loops",
+         "",
+         "Syntax:",
+         "[expression for item in iterable if condition]"
+     ],
+     """# Create a list of squares
 squares = [x**2 for x in range(1, 6)]
 print(squares)  # Output: [1, 4, 9, 16, 25]
 
@@ -212,34 +301,35 @@ print(evens)  # Output: [2, 4, 6, 8, 10]
 
 # Create a matrix (list of lists)
 matrix = [[i * j for j in range(1, 4)] for i in range(1, 4)]
-print(matrix)  # Output: [[1, 2, 3], [2, 4, 6], [3, 6, 9]]""")
-    
+print(matrix)  # Output: [[1, 2, 3], [2, 4, 6], [3, 6, 9]]"""),
+
     # Classes and Objects section
-    add_section_slide(prs, "Classes and Objects")
-    
-    add_content_slide(prs, 
-                     "Classes and Objects", 
-                     [
-                         "• Classes are blueprints for creating objects",
-                         "• Define attributes (data) and methods (functions)",
-                         "• Objects are instances of classes",
-                         "",
-                         "Class components:",
-                         "• __init__: Constructor method",
-                         "• self: Reference to the instance",
-                         "• Attributes: Variables that belong to the class",
-                         "• Methods: Functions that belong to the class"
-                     ])
-    
-    add_content_slide(prs, 
-                     "Defining a Class", 
-                     [
-                         "• Use the class keyword to define a class",
-                         "• Constructor method __init__ initializes new objects",
-                         "• self parameter refers to the instance being created",
-                         "• Instance methods operate on the object's data"
-                     ],
-                     code="""class Dog:
+    ("section", "Classes and Objects", None, None),
+
+    ("content",
+     "Classes and Objects",
+     [
+         "• Classes are blueprints for creating objects",
+         "• Define attributes (data) and methods (functions)",
+         "• Objects are instances of classes",
+         "",
+         "Class components:",
+         "• __init__: Constructor method",
+         "• self: Reference to the instance",
+         "• Attributes: Variables that belong to the class",
+         "• Methods: Functions that belong to the class"
+     ],
+     None),
+
+    ("content",
+     "Defining a Class",
+     [
+         "• Use the class keyword to define a class",
+         "• Constructor method __init__ initializes new objects",
+         "• self parameter refers to the instance being created",
+         "• Instance methods operate on the object's data"
+     ],
+     """class Dog:
     # Class attribute (shared by all instances)
     species = "Canis familiaris"
     
@@ -255,18 +345,18 @@ print(matrix)  # Output: [[1, 2, 3], [2, 4, 6], [3, 6, 9]]""")
     
     # Another instance method
     def speak(self, sound):
-        return f"{self.name} says {sound}" """)
-    
-    add_content_slide(prs, 
-                     "Creating and Using Objects", 
-                     [
-                         "• Create objects by calling the class name as a function",
-                         "• Access attributes with dot notation: object.attribute",
-                         "• Call methods with dot notation: object.method()",
-                         "• Each object has its own instance attributes",
-                         "• All objects share class attributes"
-                     ],
-                     code="""# Create Dog objects
+        return f"{self.name} says {sound}" """),
+
+    ("content",
+     "Creating and Using Objects",
+     [
+         "• Create objects by calling the class name as a function",
+         "• Access attributes with dot notation: object.attribute",
+         "• Call methods with dot notation: object.method()",
+         "• Each object has its own instance attributes",
+         "• All objects share class attributes"
+     ],
+     """# Create Dog objects
 buddy = Dog("Buddy", 9)
 miles = Dog("Miles", 4)
 
@@ -279,32 +369,33 @@ print(buddy.species)  # Output: Canis familiaris
 
 # Call methods
 print(buddy.description())  # Output: Buddy is 9 years old
-print(miles.speak("Woof"))  # Output: Miles says Woof""")
-    
+print(miles.speak("Woof"))  # Output: Miles says Woof"""),
+
     # Inheritance section
-    add_section_slide(prs, "Inheritance")
-    
-    add_content_slide(prs, 
-                     "Inheritance Basics", 
-                     [
-                         "• Inheritance allows a class to inherit attributes and methods from another class",
-                         "• Parent/Base class: The original class",
-                         "• Child/Derived class: The class that inherits",
-                         "• Promotes code reuse and establishes relationships between classes",
-                         "",
-                         "Syntax:",
-                         "class ChildClass(ParentClass):"
-                     ])
-    
-    add_content_slide(prs, 
-                     "Inheritance Example", 
-                     [
-                         "• Child class inherits all attributes and methods from parent",
-                         "• Child class can override parent methods",
-                         "• Child class can add new attributes and methods",
-                         "• super() function calls methods from the parent class"
-                     ],
-                     code="""# Parent class
+    ("section", "Inheritance", None, None),
+
+    ("content",
+     "Inheritance Basics",
+     [
+         "• Inheritance allows a class to inherit attributes and methods from another class",
+         "• Parent/Base class: The original class",
+         "• Child/Derived class: The class that inherits",
+         "• Promotes code reuse and establishes relationships between classes",
+         "",
+         "Syntax:",
+         "class ChildClass(ParentClass):"
+     ],
+     None),
+
+    ("content",
+     "Inheritance Example",
+     [
+         "• Child class inherits all attributes and methods from parent",
+         "• Child class can override parent methods",
+         "• Child class can add new attributes and methods",
+         "• super() function calls methods from the parent class"
+     ],
+     """# Parent class
 class Animal:
     def __init__(self, name, species):
         self.name = name
@@ -326,17 +417,17 @@ class Dog(Animal):
     
     # Add new method
     def wag_tail(self):
-        return f"{self.name} wags tail" """)
-    
-    add_content_slide(prs, 
-                     "Using Inheritance", 
-                     [
-                         "• Create objects of the child class",
-                         "• Access inherited attributes and methods",
-                         "• Access overridden methods",
-                         "• Access child-specific methods"
-                     ],
-                     code="""# Create objects
+        return f"{self.name} wags tail" """),
+
+    ("content",
+     "Using Inheritance",
+     [
+         "• Create objects of the child class",
+         "• Access inherited attributes and methods",
+         "• Access overridden methods",
+         "• Access child-specific methods"
+     ],
+     """# Create objects
 generic_animal = Animal("Generic", "Animal species")
 buddy = Dog("Buddy", "Golden Retriever")
 
@@ -349,31 +440,32 @@ print(buddy.name)    # Buddy
 print(buddy.species) # Canis familiaris
 
 # Use child-specific method
-print(buddy.wag_tail())  # Buddy wags tail""")
-    
+print(buddy.wag_tail())  # Buddy wags tail"""),
+
     # Polymorphism section
-    add_section_slide(prs, "Polymorphism")
-    
-    add_content_slide(prs, 
-                     "Polymorphism Basics", 
-                     [
-                         "• Polymorphism: 'many forms'",
-                         "• Allows objects of different classes to be treated as objects of a common base class",
-                         "• Enables using a single interface with different underlying forms",
-                         "• Two main types in Python:",
-                         "  - Method overriding (inheritance-based)",
-                         "  - Duck typing ('if it walks like a duck and quacks like a duck...')"
-                     ])
-    
-    add_content_slide(prs, 
-                     "Polymorphism Example", 
-                     [
-                         "• Different classes implement the same method name",
-                         "• Each class provides its own implementation",
-                         "• Code can work with different classes through a common interface",
-                         "• Makes code more flexible and extensible"
-                     ],
-                     code="""class Animal:
+    ("section", "Polymorphism", None, None),
+
+    ("content",
+     "Polymorphism Basics",
+     [
+         "• Polymorphism: 'many forms'",
+         "• Allows objects of different classes to be treated as objects of a common base class",
+         "• Enables using a single interface with different underlying forms",
+         "• Two main types in Python:",
+         "  - Method overriding (inheritance-based)",
+         "  - Duck typing ('if it walks like a duck and quacks like a duck...')"
+     ],
+     None),
+
+    ("content",
+     "Polymorphism Example",
+     [
+         "• Different classes implement the same method name",
+         "• Each class provides its own implementation",
+         "• Code can work with different classes through a common interface",
+         "• Makes code more flexible and extensible"
+     ],
+     """class Animal:
     def speak(self):
         pass
 
@@ -396,18 +488,18 @@ def animal_sound(animal):
 # Polymorphic behavior
 print(animal_sound(Dog()))   # Output: Woof!
 print(animal_sound(Cat()))   # Output: Meow!
-print(animal_sound(Duck()))  # Output: Quack!""")
-    
-    add_content_slide(prs, 
-                     "Duck Typing", 
-                     [
-                         "• Python's approach to polymorphism",
-                         "• Objects don't need to be from the same inheritance hierarchy",
-                         "• Only need to implement the required methods",
-                         "• 'If it walks like a duck and quacks like a duck, it's a duck'",
-                         "• Focuses on behavior rather than type"
-                     ],
-                     code="""class Dog:
+print(animal_sound(Duck()))  # Output: Quack!"""),
+
+    ("content",
+     "Duck Typing",
+     [
+         "• Python's approach to polymorphism",
+         "• Objects don't need to be from the same inheritance hierarchy",
+         "• Only need to implement the required methods",
+         "• 'If it walks like a duck and quacks like a duck, it's a duck'",
+         "• Focuses on behavior rather than type"
+     ],
+     """class Dog:
     def speak(self):
         return "Woof!"
 
@@ -426,60 +518,92 @@ def make_speak(entity):
 # Polymorphic behavior without inheritance
 print(make_speak(Dog()))     # Output: Woof!
 print(make_speak(Cat()))     # Output: Meow!
-print(make_speak(Person()))  # Output: Hello!""")
-    
+print(make_speak(Person()))  # Output: Hello!"""),
+
     # Real-life Project section
-    add_section_slide(prs, "Real-life Project: Online Bookstore")
-    
-    add_content_slide(prs, 
-                     "Online Bookstore Management System", 
-                     [
-                         "• Comprehensive project applying OOP concepts",
-                         "• Features:",
-                         "  - User authentication",
-                         "  - Inventory management",
-                         "  - Shopping cart functionality",
-                         "  - Order processing",
-                         "",
-                         "• Project structure:",
-                         "  - Models: Book, User, Inventory",
-                         "  - Controllers: Auth, Book, Cart",
-                         "  - Views: Command Line Interface"
-                     ])
-    
-    add_content_slide(prs, 
-                     "Project Demo", 
-                     [
-                         "• Let's explore the project structure",
-                         "• Key classes and their relationships:",
-                         "  - Book: Represents books in inventory",
-                         "  - User: Handles authentication and cart",
-                         "  - Inventory: Manages collection of books",
-                         "  - Controllers: Implement business logic",
-                         "",
-                         "• OOP concepts demonstrated:",
-                         "  - Classes and Objects",
-                         "  - Encapsulation",
-                         "  - Inheritance (structure allows for it)",
-                         "  - Polymorphism (consistent interfaces)"
-                     ])
-    
+    ("section", "Real-life Project: Online Bookstore", None, None),
+
+    ("content",
+     "Online Bookstore Management System",
+     [
+         "• Comprehensive project applying OOP concepts",
+         "• Features:",
+         "  - User authentication",
+         "  - Inventory management",
+         "  - Shopping cart functionality",
+         "  - Order processing",
+         "",
+         "• Project structure:",
+         "  - Models: Book, User, Inventory",
+         "  - Controllers: Auth, Book, Cart",
+         "  - Views: Command Line Interface"
+     ],
+     None),
+
+    ("content",
+     "Project Demo",
+     [
+         "• Let's explore the project structure",
+         "• Key classes and their relationships:",
+         "  - Book: Represents books in inventory",
+         "  - User: Handles authentication and cart",
+         "  - Inventory: Manages collection of books",
+         "  - Controllers: Implement business logic",
+         "",
+         "• OOP concepts demonstrated:",
+         "  - Classes and Objects",
+         "  - Encapsulation",
+         "  - Inheritance (structure allows for it)",
+         "  - Polymorphism (consistent interfaces)"
+     ],
+     None),
+
     # Conclusion slide
-    add_content_slide(prs, 
-                     "Conclusion", 
-                     [
-                         "• OOP in Python provides powerful tools for organizing code",
-                         "• Lambda functions offer concise ways to create small functions",
-                         "• Lists (arrays) are versatile data structures",
-                         "• Classes define blueprints for objects, encapsulating data and behavior",
-                         "• Inheritance allows for code reuse and establishing relationships",
-                         "• Polymorphism enables flexibility and extensibility",
-                         "",
-                         "• These concepts help create more maintainable, reusable, and scalable applications"
-                     ])
+    ("content",
+     "Conclusion",
+     [
+         "• OOP in Python provides powerful tools for organizing code",
+         "• Lambda functions offer concise ways to create small functions",
+         "• Lists (arrays) are versatile data structures",
+         "• Classes define blueprints for objects, encapsulating data and behavior",
+         "• Inheritance allows for code reuse and establishing relationships",
+         "• Polymorphism enables flexibility and extensibility",
+         "",
+         "• These concepts help create more maintainable, reusable, and scalable applications"
+     ],
+     None),
+]
+
+# Work out every bullet level once, when the module loads
+SLIDES = [
+    (kind, title, with_levels(body) if kind == "content" else body, code)
+    for kind, title, body, code in SLIDES
+]
+
+def create_presentation():
+    """Create the PowerPoint presentation for Python OOP lecture."""
+    prs = Presentation()
+    
+    # Set slide dimensions to 16:9 aspect ratio
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    
+    # Look the three layouts up once and hand them to the slide helpers
+    title_layout = prs.slide_layouts[0]
+    content_layout = prs.slide_layouts[1]
+    section_layout = prs.slide_layouts[2]
+    
+    # Build every slide from the SLIDES table
+    for kind, title, body, code in SLIDES:
+        if kind == "title":
+            add_title_slide(prs, title_layout, title, body)
+        elif kind == "section":
+            add_section_slide(prs, section_layout, title)
+        else:
+            add_content_slide(prs, content_layout, title, body, code)
     
     # Save the presentation
-    prs.save('/home/ubuntu/python_oop_lecture/presentation/Python_OOP_Lecture.pptx')
+    save_presentation(prs, '/home/ubuntu/python_oop_lecture/presentation/Python_OOP_Lecture.pptx')
     print("Presentation created successfully!")
 
 if __name__ == "__main__":
@@ -12,12 +12,31 @@ class AuthController:
         users (dict): Dictionary of users with username as key and User object as value
     """
     
+    # User attributes update_user may change. user_id and username are left
+    # out because users are keyed by username, and the cart and order
+    # history are managed through their own methods.
+    _UPDATABLE_FIELDS = frozenset({'password', 'name', 'email', 'address', 'is_admin'})
+    
     def __init__(self):
         """
         Initialize a new AuthController instance.
         """
         self.users = {}
         self.current_user = None
+        # Login state flags, kept in step with current_user by _set_current_user
+        self._logged_in = False
+        self._is_admin = False
+    
+    def _set_current_user(self, user):
+        """
+        Set the current user and refresh the cached login state flags.
+        
+        Args:
+            user: User object to make current, or None to clear it
+        """
+        self.current_user = user
+        self._logged_in = user is not None
+        self._is_admin = user is not None and bool(user.is_admin)
     
     def register_user(self, user):
         """
@@ -29,11 +48,28 @@ class AuthController:
         Returns:
             bool: True if registered successfully, False if username already exists
         """
-        if user.username in self.users:
-            return False
+        # setdefault only stores the user if the username is free, in one lookup;
+        # the dict grows only when it did, even if this same user is already in it
+        size = len(self.users)
+        self.users.setdefault(user.username, user)
+        return len(self.users) > size
+    
+    def register_users(self, users):
+        """
+        Register several users in one call.
         
-        self.users[user.username] = user
-        return True
+        Args:
+            users: Iterable of User objects to register
+            
+        Returns:
+            list: One bool per user, True if registered, False if the username already exists
+        """
+        registered = []
+        for user in users:
+            size = len(self.users)
+            self.users.setdefault(user.username, user)
+            registered.append(len(self.users) > size)
+        return registered
     
     def login(self, username, password):
         """
@@ -48,7 +84,7 @@ class AuthController:
         """
         user = self.users.get(username)
         if user and user.authenticate(password):
-            self.current_user = user
+            self._set_current_user(user)
             return user
         return None
     
@@ -60,7 +96,7 @@ class AuthController:
             bool: True if logout successful, False if no user logged in
         """
         if self.current_user:
-            self.current_user = None
+            self._set_current_user(None)
             return True
         return False
     
@@ -80,7 +116,7 @@ class AuthController:
         Returns:
             bool: True if a user is logged in, False otherwise
         """
-        return self.current_user is not None
+        return self._logged_in
     
     def is_admin(self):
         """
@@ -89,7 +125,7 @@ class AuthController:
         Returns:
             bool: True if current user is an admin, False otherwise
         """
-        return self.current_user is not None and self.current_user.is_admin
+        return self._is_admin
     
     def get_user(self, username):
         """
@@ -108,9 +144,10 @@ class AuthController:
         Get all registered users.
         
         Returns:
-            list: List of all User objects
+            dict_values: Live view of all User objects; wrap it in list() if
+                you need indexing or a snapshot
         """
-        return list(self.users.values())
+        return self.users.values()
     
     def update_user(self, username, **kwargs):
         """
@@ -118,7 +155,8 @@ class AuthController:
         
         Args:
             username (str): Username of user to update
-            **kwargs: Attributes to update
+            **kwargs: Attributes to update (password, name, email, address,
+                is_admin); any other keys are ignored
             
         Returns:
             bool: True if updated, False if not found
@@ -127,10 +165,15 @@ class AuthController:
         if not user:
             return False
         
+        allowed = self._UPDATABLE_FIELDS
         for key, value in kwargs.items():
-            if hasattr(user, key):
+            if key in allowed:
                 setattr(user, key, value)
         
+        # Keep the cached admin flag right if the current user was changed
+        if user is self.current_user:
+            self._set_current_user(user)
+        
         return True
     
     def delete_user(self, username):
@@ -143,11 +186,11 @@ class AuthController:
         Returns:
             bool: True if deleted, False if not found
         """
-        if username in self.users:
-            # Logout if deleting current user
-            if self.current_user and self.current_user.username == username:
-                self.logout()
-            
-            del self.users[username]
-            return True
-        return False
+        user = self.users.pop(username, None)
+        if user is None:
+            return False
+        
+        # Logout if deleting current user
+        if user is self.current_user:
+            self.logout()
+        return True
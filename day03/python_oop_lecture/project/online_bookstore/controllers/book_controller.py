@@ -11,8 +11,17 @@ class BookController:
     Attributes:
         inventory (Inventory): Inventory object to manage
         auth_controller (AuthController): Authentication controller for permission checks
+    
+    The read-only lookups get_book, search_books, get_all_books,
+    get_books_by_genre and get_books_by_author are the inventory's own bound
+    methods, set on each instance in __init__, so calling them through the
+    controller adds no extra function call.
     """
     
+    # Read-only lookups passed straight through to the inventory
+    _LOOKUP_METHODS = ('get_book', 'search_books', 'get_all_books',
+                       'get_books_by_genre', 'get_books_by_author')
+    
     def __init__(self, inventory, auth_controller):
         """
         Initialize a new BookController instance.
@@ -23,6 +32,8 @@ class BookController:
         """
         self.inventory = inventory
         self.auth_controller = auth_controller
+        for name in self._LOOKUP_METHODS:
+            setattr(self, name, getattr(inventory, name))
     
     def add_book(self, book):
         """
@@ -70,63 +81,6 @@ class BookController:
         
         return self.inventory.update_book(book_id, **kwargs)
     
-    def get_book(self, book_id):
-        """
-        Get a book by ID.
-        
-        Args:
-            book_id (str): ID of book to get
-            
-        Returns:
-            Book: Book object if found, None otherwise
-        """
-        return self.inventory.get_book(book_id)
-    
-    def search_books(self, **kwargs):
-        """
-        Search for books by various criteria.
-        
-        Args:
-            **kwargs: Search criteria (e.g., title, author, genre)
-            
-        Returns:
-            list: List of matching Book objects
-        """
-        return self.inventory.search_books(**kwargs)
-    
-    def get_all_books(self):
-        """
-        Get all books in the inventory.
-        
-        Returns:
-            list: List of all Book objects
-        """
-        return self.inventory.get_all_books()
-    
-    def get_books_by_genre(self, genre):
-        """
-        Get books by genre.
-        
-        Args:
-            genre (str): Genre to search for
-            
-        Returns:
-            list: List of matching Book objects
-        """
-        return self.inventory.get_books_by_genre(genre)
-    
-    def get_books_by_author(self, author):
-        """
-        Get books by author.
-        
-        Args:
-            author (str): Author to search for
-            
-        Returns:
-            list: List of matching Book objects
-        """
-        return self.inventory.get_books_by_author(author)
-    
     def get_low_stock_books(self, threshold=5):
         """
         Get books with low stock (admin only).
@@ -4,21 +4,26 @@ Main Application for Online Bookstore Management System
 This module initializes and runs the Online Bookstore Management System.
 """
 
-from models.book import Book
-from models.user import User
+import argparse
+
 from models.inventory import Inventory
 from controllers.auth_controller import AuthController
 from controllers.book_controller import BookController
 from controllers.cart_controller import CartController
-from views.cli import CLI
 
-def initialize_sample_data():
+def initialize_sample_data(seed_books=True):
     """
     Initialize sample data for demonstration purposes.
     
+    Args:
+        seed_books (bool, optional): Whether to add the sample books. Defaults to True.
+    
     Returns:
         tuple: (auth_controller, book_controller, cart_controller)
     """
+    # Models are only needed here, so they are imported when data is built
+    from models.user import User
+    
     # Create controllers
     auth_controller = AuthController()
     inventory = Inventory()
@@ -29,10 +34,13 @@ def initialize_sample_data():
     admin = User("U001", "admin", "admin123", "Admin User", "admin@bookstore.com", "123 Admin St", True)
     customer = User("U002", "customer", "customer123", "John Doe", "john@example.com", "456 Customer Ave")
     
-    auth_controller.register_user(admin)
-    auth_controller.register_user(customer)
+    auth_controller.register_users([admin, customer])
+    
+    if not seed_books:
+        return auth_controller, book_controller, cart_controller
     
     # Add sample books
+    from models.book import Book
     books = [
         Book("B001", "Python Programming", "John Smith", "978-1-123456-78-9", 29.99, 10, "Programming", "Tech Books Inc", 2022),
         Book("B002", "Data Science Basics", "Jane Doe", "978-1-234567-89-0", 34.99, 8, "Programming", "Data Press", 2021),
@@ -46,8 +54,9 @@ def initialize_sample_data():
         Book("B010", "Machine Learning", "Jennifer Taylor", "978-9-012345-67-8", 42.99, 4, "Programming", "AI Publishers", 2023)
     ]
     
-    for book in books:
-        book_controller.add_book(book)
+    # Seeding is setup rather than an admin action, so it goes straight to
+    # the inventory instead of through the admin-only BookController.add_book
+    inventory.add_books(books)
     
     return auth_controller, book_controller, cart_controller
 
@@ -55,10 +64,16 @@ def main():
     """
     Main function to run the application.
     """
+    parser = argparse.ArgumentParser(description="Online Bookstore Management System")
+    parser.add_argument("--no-seed", dest="seed_books", action="store_false",
+                        help="start with an empty catalog instead of the sample books")
+    args = parser.parse_args()
+    
     print("Initializing Online Bookstore Management System...")
-    auth_controller, book_controller, cart_controller = initialize_sample_data()
+    auth_controller, book_controller, cart_controller = initialize_sample_data(args.seed_books)
     
-    # Create and run CLI
+    # Create and run CLI (imported here so --help returns without loading it)
+    from views.cli import CLI
     cli = CLI(auth_controller, book_controller, cart_controller)
     cli.run()
 
@@ -4,6 +4,8 @@ Book Model for Online Bookstore Management System
 This module defines the Book class which represents a book in the bookstore inventory.
 """
 
+import sys
+
 class Book:
     """
     Represents a book in the bookstore inventory.
@@ -20,6 +22,13 @@ class Book:
         publication_year (int): Year the book was published
     """
     
+    # Fixed attribute slots instead of a per-instance __dict__. price and
+    # quantity are properties over _price_cents and _quantity (see below),
+    # and _inventory is the Inventory holding the book, set by that Inventory.
+    # _str_cache holds the text built by __str__ until the book changes.
+    __slots__ = ('book_id', 'title', 'author', 'isbn', '_price_cents', '_quantity',
+                 'genre', 'publisher', 'publication_year', '_inventory', '_str_cache')
+    
     def __init__(self, book_id, title, author, isbn, price, quantity, genre, publisher, publication_year):
         """
         Initialize a new Book instance.
@@ -39,12 +48,51 @@ class Book:
         self.title = title
         self.author = author
         self.isbn = isbn
-        self.price = price
-        self.quantity = quantity
-        self.genre = genre
-        self.publisher = publisher
+        self._price_cents = round(price * 100)
+        self._quantity = quantity
+        self._inventory = None
+        self._str_cache = None
+        # Genres and publishers repeat across many books, so every book
+        # shares one interned copy of each instead of holding its own
+        self.genre = sys.intern(genre) if isinstance(genre, str) else genre
+        self.publisher = sys.intern(publisher) if isinstance(publisher, str) else publisher
         self.publication_year = publication_year
     
+    @property
+    def price(self):
+        """float: Price of the book, stored as a whole number of cents"""
+        return self._price_cents / 100
+    
+    @price.setter
+    def price(self, value):
+        self.price_cents = round(value * 100)
+    
+    @property
+    def price_cents(self):
+        """int: Price of the book in whole cents"""
+        return self._price_cents
+    
+    @price_cents.setter
+    def price_cents(self, cents):
+        # Keep the owning inventory's running total value in step
+        if self._inventory is not None:
+            self._inventory._total_cents += (cents - self._price_cents) * self._quantity
+        self._price_cents = cents
+        self._str_cache = None
+    
+    @property
+    def quantity(self):
+        """int: Available quantity in stock"""
+        return self._quantity
+    
+    @quantity.setter
+    def quantity(self, value):
+        # Keep the owning inventory's running total value in step
+        if self._inventory is not None:
+            self._inventory._total_cents += (value - self._quantity) * self._price_cents
+        self._quantity = value
+        self._str_cache = None
+    
     def update_quantity(self, amount):
         """
         Update the quantity of books in stock.
@@ -110,7 +158,11 @@ class Book:
         Returns:
             str: Formatted string with book information
         """
-        return f"{self.title} by {self.author} (${self.price}) - {self.quantity} in stock"
+        # Built once and reused by every listing until the price or quantity
+        # changes, or Inventory.update_book edits the book
+        if self._str_cache is None:
+            self._str_cache = f"{self.title} by {self.author} (${self.price}) - {self.quantity} in stock"
+        return self._str_cache
     
     def __repr__(self):
         """
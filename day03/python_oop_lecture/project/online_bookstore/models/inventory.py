@@ -4,6 +4,9 @@ Inventory Management for Online Bookstore Management System
 This module defines the Inventory class which manages the bookstore inventory.
 """
 
+import sys
+from operator import attrgetter
+
 class Inventory:
     """
     Manages the bookstore inventory.
@@ -12,11 +15,42 @@ class Inventory:
         books (dict): Dictionary of books with book_id as key and Book object as value
     """
     
+    # Book attributes search_books can filter on
+    _SEARCH_FIELDS = frozenset({'book_id', 'title', 'author', 'isbn', 'price', 'quantity',
+                                'genre', 'publisher', 'publication_year'})
+    # Text attributes whose lowercase form is kept for case-insensitive search
+    _TEXT_FIELDS = ('book_id', 'title', 'author', 'isbn', 'genre', 'publisher')
+    # Book attributes update_book may change. book_id is left out because
+    # books are keyed by it, and the private slots are left out because price,
+    # price_cents and quantity must go through their setters to keep
+    # _total_cents right.
+    _UPDATABLE_FIELDS = frozenset({'title', 'author', 'isbn', 'price', 'price_cents',
+                                   'quantity', 'genre', 'publisher', 'publication_year'})
+    
     def __init__(self):
         """
         Initialize a new Inventory instance.
         """
         self.books = {}
+        # Lowercase text of every book, {book_id: {attribute: text}}, kept in
+        # step by add_book, remove_book and update_book for search_books
+        self._search_text = {}
+        # Sum of price * quantity over all books, in cents. Books report their
+        # own price and quantity changes to it, so total_inventory_value needs
+        # no scan, and integer cents keep the sum exact.
+        self._total_cents = 0
+    
+    def _index_text(self, book_id, book):
+        """
+        Store the lowercase form of a book's text attributes for searching.
+        
+        Args:
+            book_id (str): Key of the book in the inventory
+            book: Book object to index
+        """
+        self._search_text[book_id] = {key: getattr(book, key).lower()
+                                      for key in self._TEXT_FIELDS
+                                      if isinstance(getattr(book, key), str)}
     
     def add_book(self, book):
         """
@@ -32,8 +66,34 @@ class Inventory:
             return False
         
         self.books[book.book_id] = book
+        self._index_text(book.book_id, book)
+        book._inventory = self
+        self._total_cents += book._price_cents * book.quantity
         return True
     
+    def add_books(self, books):
+        """
+        Add several books to the inventory in one call.
+        
+        Args:
+            books: Iterable of Book objects to add
+            
+        Returns:
+            int: Number of books added; books whose book_id already exists are skipped
+        """
+        existing = self.books
+        new_books = {}
+        for book in books:
+            if book.book_id not in existing:
+                new_books.setdefault(book.book_id, book)
+        
+        existing.update(new_books)
+        for book_id, book in new_books.items():
+            self._index_text(book_id, book)
+            book._inventory = self
+            self._total_cents += book._price_cents * book.quantity
+        return len(new_books)
+    
     def remove_book(self, book_id):
         """
         Remove a book from the inventory.
@@ -44,8 +104,11 @@ class Inventory:
         Returns:
             bool: True if removed, False if not found
         """
-        if book_id in self.books:
-            del self.books[book_id]
+        book = self.books.pop(book_id, None)
+        if book is not None:
+            del self._search_text[book_id]
+            book._inventory = None
+            self._total_cents -= book._price_cents * book.quantity
             return True
         return False
     
@@ -67,7 +130,7 @@ class Inventory:
         
         Args:
             book_id (str): ID of book to update
-            **kwargs: Attributes to update
+            **kwargs: Attributes to update; other keys are ignored
             
         Returns:
             bool: True if updated, False if not found
@@ -76,10 +139,16 @@ class Inventory:
         if not book:
             return False
         
+        allowed = self._UPDATABLE_FIELDS
         for key, value in kwargs.items():
-            if hasattr(book, key):
+            if key in allowed:
+                # Genres and publishers repeat across many books; share one copy
+                if key in ('genre', 'publisher') and isinstance(value, str):
+                    value = sys.intern(value)
                 setattr(book, key, value)
         
+        book._str_cache = None
+        self._index_text(book_id, book)
         return True
     
     def search_books(self, **kwargs):
@@ -92,26 +161,24 @@ class Inventory:
         Returns:
             list: List of matching Book objects
         """
+        # Sort the criteria once per query: case-insensitive substring tests
+        # on text attributes, exact comparisons on the rest. Keys that are not
+        # book attributes are ignored.
+        text_criteria = []
+        exact_criteria = []
+        for key, value in kwargs.items():
+            if key in self._TEXT_FIELDS and isinstance(value, str):
+                text_criteria.append((key, value.lower()))
+            elif key in self._SEARCH_FIELDS:
+                exact_criteria.append((attrgetter(key), value))
+        
         results = []
+        search_text = self._search_text
         
-        for book in self.books.values():
-            match = True
-            
-            for key, value in kwargs.items():
-                if hasattr(book, key):
-                    book_value = getattr(book, key)
-                    
-                    # Case-insensitive string comparison
-                    if isinstance(book_value, str) and isinstance(value, str):
-                        if value.lower() not in book_value.lower():
-                            match = False
-                            break
-                    # Exact match for non-string values
-                    elif book_value != value:
-                        match = False
-                        break
-            
-            if match:
+        for book_id, book in self.books.items():
+            book_text = search_text[book_id]
+            if (all(value in book_text.get(key, '') for key, value in text_criteria)
+                    and all(get(book) == value for get, value in exact_criteria)):
                 results.append(book)
         
         return results
@@ -168,7 +235,7 @@ class Inventory:
         Returns:
             float: Total value
         """
-        return sum(book.price * book.quantity for book in self.books.values())
+        return self._total_cents / 100
     
     def __len__(self):
         """
@@ -18,6 +18,10 @@ class User:
         is_admin (bool): Whether the user has admin privileges
     """
     
+    # Fixed attribute slots instead of a per-instance __dict__
+    __slots__ = ('user_id', 'username', 'password', 'name', 'email', 'address',
+                 'is_admin', '_cart', 'order_history')
+    
     def __init__(self, user_id, username, password, name, email, address, is_admin=False):
         """
         Initialize a new User instance.
@@ -38,9 +42,19 @@ class User:
         self.email = email
         self.address = address
         self.is_admin = is_admin
-        self.cart = []  # List to store cart items
+        self._cart = {}  # Cart items keyed by book_id, see the cart property
         self.order_history = []  # List to store past orders
     
+    @property
+    def cart(self):
+        """
+        Items in the user's cart, in the order they were added.
+        
+        Returns:
+            list: List of {'book': Book, 'quantity': int} dictionaries
+        """
+        return list(self._cart.values())
+    
     def authenticate(self, password):
         """
         Authenticate the user with a password.
@@ -90,13 +104,13 @@ class User:
             return False
         
         # Check if book already in cart
-        for item in self.cart:
-            if item['book'].book_id == book.book_id:
-                item['quantity'] += quantity
-                return True
+        item = self._cart.get(book.book_id)
+        if item is not None:
+            item['quantity'] += quantity
+            return True
         
         # Add new item to cart
-        self.cart.append({'book': book, 'quantity': quantity})
+        self._cart[book.book_id] = {'book': book, 'quantity': quantity}
         return True
     
     def remove_from_cart(self, book_id):
@@ -109,11 +123,7 @@ class User:
         Returns:
             bool: True if removed, False if not found
         """
-        for i, item in enumerate(self.cart):
-            if item['book'].book_id == book_id:
-                self.cart.pop(i)
-                return True
-        return False
+        return self._cart.pop(book_id, None) is not None
     
     def update_cart_quantity(self, book_id, quantity):
         """
@@ -129,13 +139,11 @@ class User:
         if quantity <= 0:
             return self.remove_from_cart(book_id)
         
-        for item in self.cart:
-            if item['book'].book_id == book_id:
-                if item['book'].quantity < quantity:
-                    return False
-                item['quantity'] = quantity
-                return True
-        return False
+        item = self._cart.get(book_id)
+        if item is None or item['book'].quantity < quantity:
+            return False
+        item['quantity'] = quantity
+        return True
     
     def get_cart_total(self):
         """
@@ -144,13 +152,15 @@ class User:
         Returns:
             float: Total price
         """
-        return sum(item['book'].price * item['quantity'] for item in self.cart)
+        # Add up whole cents so the total carries no float rounding error
+        return sum(item['book']._price_cents * item['quantity']
+                   for item in self._cart.values()) / 100
     
     def clear_cart(self):
         """
         Clear all items from the cart.
         """
-        self.cart = []
+        self._cart = {}
     
     def place_order(self, order_id, payment_method):
         """
@@ -163,9 +173,15 @@ class User:
         Returns:
             dict: Order information
         """
-        if not self.cart:
+        if not self._cart:
             return None
         
+        # Check every item is in stock before changing anything, so a
+        # failed order leaves the inventory untouched
+        for item in self._cart.values():
+            if item['book'].quantity < item['quantity']:
+                return None
+        
         # Create order from cart
         order = {
             'order_id': order_id,
@@ -177,16 +193,13 @@ class User:
         }
         
         # Add items and update inventory
-        for item in self.cart:
+        for item in self._cart.values():
             book = item['book']
             quantity = item['quantity']
             
-            # Update book quantity
-            if not book.update_quantity(-quantity):
-                # Rollback previous updates if any item fails
-                for prev_item in order['items']:
-                    prev_item['book'].update_quantity(prev_item['quantity'])
-                return None
+            # Update book quantity directly: stock was checked above, so
+            # update_quantity's own check would only repeat it
+            book.quantity -= quantity
             
             order['items'].append({
                 'book': book,
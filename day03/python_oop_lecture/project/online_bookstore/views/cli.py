@@ -4,6 +4,15 @@ Command Line Interface View for Online Bookstore Management System
 This module defines the CLI class which provides a text-based interface for the bookstore system.
 """
 
+import sys
+import uuid
+
+from models.book import Book
+from models.user import User
+
+# Answers accepted as "yes" at (y/n) prompts
+_YES = frozenset({'y', 'Y', 'yes', 'Yes', 'YES'})
+
 class CLI:
     """
     Provides a text-based interface for the bookstore system.
@@ -14,6 +23,57 @@ class CLI:
         cart_controller (CartController): Cart controller
     """
     
+    # Main menu choices: the method each one runs and who may run it
+    # (None for anyone, 'user' once logged in, 'admin' for admins only).
+    # Choice 5, Exit, is handled by run() itself.
+    _MENU_ACTIONS = {
+        "1": ('login', None),
+        "2": ('register', None),
+        "3": ('browse_books', None),
+        "4": ('search_books', None),
+        "6": ('view_cart', 'user'),
+        "7": ('checkout', 'user'),
+        "8": ('view_order_history', 'user'),
+        "9": ('logout', 'user'),
+        "10": ('add_book', 'admin'),
+        "11": ('update_book', 'admin'),
+        "12": ('remove_book', 'admin'),
+        "13": ('view_low_stock', 'admin'),
+        "14": ('view_inventory_value', 'admin'),
+    }
+    
+    # Menu text, built once; display_menu writes the parts the user may see
+    _MENU_MAIN = "\n".join([
+        "\nMain Menu:",
+        "1. Login",
+        "2. Register",
+        "3. Browse Books",
+        "4. Search Books",
+        "5. Exit",
+    ]) + "\n"
+    _MENU_USER = "\n".join([
+        "\nUser Menu:",
+        "6. View Cart",
+        "7. Checkout",
+        "8. View Order History",
+        "9. Logout",
+    ]) + "\n"
+    _MENU_ADMIN = "\n".join([
+        "\nAdmin Menu:",
+        "10. Add Book",
+        "11. Update Book",
+        "12. Remove Book",
+        "13. View Low Stock Books",
+        "14. View Inventory Value",
+    ]) + "\n"
+    
+    # Search menu choices and the book attribute each one searches
+    _SEARCH_CHOICES = {
+        "1": 'title',
+        "2": 'author',
+        "3": 'genre',
+    }
+    
     def __init__(self, auth_controller, book_controller, cart_controller):
         """
         Initialize a new CLI instance.
@@ -26,6 +86,8 @@ class CLI:
         self.auth_controller = auth_controller
         self.book_controller = book_controller
         self.cart_controller = cart_controller
+        self._actions = {choice: (getattr(self, name), access)
+                         for choice, (name, access) in self._MENU_ACTIONS.items()}
     
     def display_welcome(self):
         """
@@ -39,28 +101,11 @@ class CLI:
         """
         Display main menu.
         """
-        print("\nMain Menu:")
-        print("1. Login")
-        print("2. Register")
-        print("3. Browse Books")
-        print("4. Search Books")
-        print("5. Exit")
-        
+        sys.stdout.write(self._MENU_MAIN)
         if self.auth_controller.is_logged_in():
-            user = self.auth_controller.get_current_user()
-            print("\nUser Menu:")
-            print("6. View Cart")
-            print("7. Checkout")
-            print("8. View Order History")
-            print("9. Logout")
-            
+            sys.stdout.write(self._MENU_USER)
             if self.auth_controller.is_admin():
-                print("\nAdmin Menu:")
-                print("10. Add Book")
-                print("11. Update Book")
-                print("12. Remove Book")
-                print("13. View Low Stock Books")
-                print("14. View Inventory Value")
+                sys.stdout.write(self._MENU_ADMIN)
     
     def login(self):
         """
@@ -88,7 +133,6 @@ class CLI:
         email = input("Email: ")
         address = input("Address: ")
         
-        from ..models.user import User
         user = User(user_id, username, password, name, email, address)
         
         if self.auth_controller.register_user(user):
@@ -107,8 +151,8 @@ class CLI:
             print("No books available.")
             return
         
-        for i, book in enumerate(books, 1):
-            print(f"{i}. {book}")
+        # Stream the listing line by line rather than building it all first
+        sys.stdout.writelines(f"{i}. {book}\n" for i, book in enumerate(books, 1))
         
         if self.auth_controller.is_logged_in():
             self.prompt_add_to_cart(books)
@@ -118,34 +162,54 @@ class CLI:
         Search for books.
         """
         print("\n--- Search Books ---")
-        print("1. Search by Title")
-        print("2. Search by Author")
-        print("3. Search by Genre")
-        choice = input("Enter choice (1-3): ")
+        for choice, field in self._SEARCH_CHOICES.items():
+            print(f"{choice}. Search by {field.title()}")
+        choice = input(f"Enter choice (1-{len(self._SEARCH_CHOICES)}): ")
         
-        if choice == "1":
-            title = input("Enter title: ")
-            books = self.book_controller.search_books(title=title)
-        elif choice == "2":
-            author = input("Enter author: ")
-            books = self.book_controller.get_books_by_author(author)
-        elif choice == "3":
-            genre = input("Enter genre: ")
-            books = self.book_controller.get_books_by_genre(genre)
-        else:
+        field = self._SEARCH_CHOICES.get(choice)
+        if field is None:
             print("Invalid choice.")
             return
         
+        value = input(f"Enter {field}: ")
+        books = self.book_controller.search_books(**{field: value})
+        
         if not books:
             print("No books found.")
             return
         
-        for i, book in enumerate(books, 1):
-            print(f"{i}. {book}")
+        # Stream the listing line by line rather than building it all first
+        sys.stdout.writelines(f"{i}. {book}\n" for i, book in enumerate(books, 1))
         
         if self.auth_controller.is_logged_in():
             self.prompt_add_to_cart(books)
     
+    def _read_int(self, prompt, invalid_message, minimum=None, maximum=None, range_message=None):
+        """
+        Prompt for a whole number within optional bounds.
+        
+        Args:
+            prompt (str): Prompt to show
+            invalid_message (str): Message printed if the answer is not a whole number
+            minimum (int, optional): Smallest accepted value. Defaults to None.
+            maximum (int, optional): Largest accepted value. Defaults to None.
+            range_message (str, optional): Message printed if the value is out of
+                bounds. Defaults to invalid_message.
+            
+        Returns:
+            int: The number entered, or None if it was rejected
+        """
+        try:
+            value = int(input(prompt))
+        except ValueError:
+            print(invalid_message)
+            return None
+        
+        if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+            print(range_message or invalid_message)
+            return None
+        return value
+    
     def prompt_add_to_cart(self, books):
         """
         Prompt user to add a book to cart.
@@ -154,32 +218,43 @@ class CLI:
             books (list): List of Book objects
         """
         choice = input("\nAdd a book to cart? (y/n): ")
-        if choice.lower() != 'y':
+        if choice not in _YES:
             return
         
-        book_num = input("Enter book number: ")
-        try:
-            book_num = int(book_num)
-            if book_num < 1 or book_num > len(books):
-                print("Invalid book number.")
-                return
-            
-            book = books[book_num - 1]
-            quantity = input("Enter quantity: ")
-            try:
-                quantity = int(quantity)
-                if quantity < 1:
-                    print("Quantity must be positive.")
-                    return
-                
-                if self.cart_controller.add_to_cart(book.book_id, quantity):
-                    print(f"Added {quantity} copy/copies of '{book.title}' to cart.")
-                else:
-                    print("Failed to add to cart. Not enough in stock.")
-            except ValueError:
-                print("Invalid quantity.")
-        except ValueError:
-            print("Invalid book number.")
+        book_num = self._read_int("Enter book number: ", "Invalid book number.",
+                                  minimum=1, maximum=len(books))
+        if book_num is None:
+            return
+        
+        book = books[book_num - 1]
+        quantity = self._read_int("Enter quantity: ", "Invalid quantity.",
+                                  minimum=1, range_message="Quantity must be positive.")
+        if quantity is None:
+            return
+        
+        if self.cart_controller.add_to_cart(book.book_id, quantity):
+            print(f"Added {quantity} copy/copies of '{book.title}' to cart.")
+        else:
+            print("Failed to add to cart. Not enough in stock.")
+    
+    def _show_cart_items(self, cart):
+        """
+        Display each cart item with its line total, then the cart total.
+        
+        Args:
+            cart (list): Cart items from the cart controller
+        """
+        # The total is added up in the same pass, in whole cents like
+        # User.get_cart_total, rather than walking the cart a second time
+        lines = []
+        total_cents = 0
+        for i, item in enumerate(cart, 1):
+            book = item['book']
+            quantity = item['quantity']
+            total_cents += book.price_cents * quantity
+            lines.append(f"{i}. {book.title} - ${book.price} x {quantity} = ${book.price * quantity}\n")
+        lines.append(f"\nTotal: ${total_cents / 100}\n")
+        sys.stdout.write(''.join(lines))
     
     def view_cart(self):
         """
@@ -196,13 +271,7 @@ class CLI:
             print("Your cart is empty.")
             return
         
-        for i, item in enumerate(cart, 1):
-            book = item['book']
-            quantity = item['quantity']
-            total = book.price * quantity
-            print(f"{i}. {book.title} - ${book.price} x {quantity} = ${total}")
-        
-        print(f"\nTotal: ${self.cart_controller.get_cart_total()}")
+        self._show_cart_items(cart)
         
         print("\nCart Options:")
         print("1. Update Quantity")
@@ -213,73 +282,59 @@ class CLI:
         choice = input("Enter choice (1-4): ")
         
         if choice == "1":
-            self.update_cart_quantity()
+            self.update_cart_quantity(cart)
         elif choice == "2":
-            self.remove_from_cart()
+            self.remove_from_cart(cart)
         elif choice == "3":
             self.clear_cart()
     
-    def update_cart_quantity(self):
+    def update_cart_quantity(self, cart):
         """
         Update quantity of an item in cart.
+        
+        Args:
+            cart (list): Cart items as shown by view_cart
         """
-        cart = self.cart_controller.get_cart()
-        item_num = input("Enter item number: ")
+        item_num = self._read_int("Enter item number: ", "Invalid item number.",
+                                  minimum=1, maximum=len(cart))
+        if item_num is None:
+            return
         
-        try:
-            item_num = int(item_num)
-            if item_num < 1 or item_num > len(cart):
-                print("Invalid item number.")
-                return
-            
-            item = cart[item_num - 1]
-            book_id = item['book'].book_id
-            
-            quantity = input("Enter new quantity: ")
-            try:
-                quantity = int(quantity)
-                if quantity < 0:
-                    print("Quantity must be non-negative.")
-                    return
-                
-                if self.cart_controller.update_cart_quantity(book_id, quantity):
-                    print("Quantity updated.")
-                else:
-                    print("Failed to update quantity. Not enough in stock.")
-            except ValueError:
-                print("Invalid quantity.")
-        except ValueError:
-            print("Invalid item number.")
+        book_id = cart[item_num - 1]['book'].book_id
+        quantity = self._read_int("Enter new quantity: ", "Invalid quantity.",
+                                  minimum=0, range_message="Quantity must be non-negative.")
+        if quantity is None:
+            return
+        
+        if self.cart_controller.update_cart_quantity(book_id, quantity):
+            print("Quantity updated.")
+        else:
+            print("Failed to update quantity. Not enough in stock.")
     
-    def remove_from_cart(self):
+    def remove_from_cart(self, cart):
         """
         Remove an item from cart.
+        
+        Args:
+            cart (list): Cart items as shown by view_cart
         """
-        cart = self.cart_controller.get_cart()
-        item_num = input("Enter item number: ")
+        item_num = self._read_int("Enter item number: ", "Invalid item number.",
+                                  minimum=1, maximum=len(cart))
+        if item_num is None:
+            return
         
-        try:
-            item_num = int(item_num)
-            if item_num < 1 or item_num > len(cart):
-                print("Invalid item number.")
-                return
-            
-            item = cart[item_num - 1]
-            book_id = item['book'].book_id
-            
-            if self.cart_controller.remove_from_cart(book_id):
-                print("Item removed from cart.")
-            else:
-                print("Failed to remove item.")
-        except ValueError:
-            print("Invalid item number.")
+        book_id = cart[item_num - 1]['book'].book_id
+        if self.cart_controller.remove_from_cart(book_id):
+            print("Item removed from cart.")
+        else:
+            print("Failed to remove item.")
     
     def clear_cart(self):
         """
         Clear all items from cart.
         """
         confirm = input("Are you sure you want to clear your cart? (y/n): ")
-        if confirm.lower() == 'y':
+        if confirm in _YES:
             if self.cart_controller.clear_cart():
                 print("Cart cleared.")
             else:
@@ -300,22 +355,14 @@ class CLI:
         
         print("\n--- Checkout ---")
         print("Cart Summary:")
-        
-        for i, item in enumerate(cart, 1):
-            book = item['book']
-            quantity = item['quantity']
-            total = book.price * quantity
-            print(f"{i}. {book.title} - ${book.price} x {quantity} = ${total}")
-        
-        print(f"\nTotal: ${self.cart_controller.get_cart_total()}")
+        self._show_cart_items(cart)
         
         confirm = input("Proceed with checkout? (y/n): ")
-        if confirm.lower() != 'y':
+        if confirm not in _YES:
             return
         
         payment_method = input("Enter payment method: ")
-        import uuid
-        order_id = str(uuid.uuid4())
+        order_id = uuid.uuid4().hex
         
         order = self.cart_controller.checkout(order_id, payment_method)
         if order:
@@ -338,21 +385,22 @@ class CLI:
             print("No orders found.")
             return
         
+        lines = []
         for order in orders:
-            print(f"Order ID: {order['order_id']}")
-            print(f"Status: {order['status']}")
-            print(f"Payment Method: {order['payment_method']}")
-            print("Items:")
+            lines.append(f"Order ID: {order['order_id']}\n"
+                         f"Status: {order['status']}\n"
+                         f"Payment Method: {order['payment_method']}\n"
+                         "Items:\n")
             
             for item in order['items']:
                 book = item['book']
                 quantity = item['quantity']
                 price = item['price']
                 total = price * quantity
-                print(f"- {book.title} - ${price} x {quantity} = ${total}")
+                lines.append(f"- {book.title} - ${price} x {quantity} = ${total}\n")
             
-            print(f"Total: ${order['total']}")
-            print("-" * 30)
+            lines.append(f"Total: ${order['total']}\n{'-' * 30}\n")
+        sys.stdout.write(''.join(lines))
     
     def add_book(self):
         """
@@ -379,7 +427,6 @@ class CLI:
         genre = input("Genre: ")
         publisher = input("Publisher: ")
         
-        from ..models.book import Book
         book = Book(book_id, title, author, isbn, price, quantity, genre, publisher, publication_year)
         
         if self.book_controller.add_book(book):
@@ -454,7 +501,7 @@ class CLI:
             return
         
         confirm = input(f"Are you sure you want to remove '{book.title}'? (y/n): ")
-        if confirm.lower() == 'y':
+        if confirm in _YES:
             if self.book_controller.remove_book(book_id):
                 print("Book removed successfully.")
             else:
@@ -479,8 +526,8 @@ class CLI:
                 print(f"No books with stock below {threshold}.")
                 return
             
-            for i, book in enumerate(books, 1):
-                print(f"{i}. {book.title} - {book.quantity} in stock")
+            sys.stdout.write(''.join([f"{i}. {book.title} - {book.quantity} in stock\n"
+                                      for i, book in enumerate(books, 1)]))
         except ValueError:
             print("Invalid threshold.")
     
@@ -510,38 +557,28 @@ class CLI:
         """
         self.display_welcome()
         
+        # Resolve the methods used on every pass once, before the loop
+        display_menu = self.display_menu
+        is_logged_in = self.auth_controller.is_logged_in
+        check_admin = self.auth_controller.is_admin
+        get_action = self._actions.get
+        
         while True:
-            self.display_menu()
+            display_menu()
             choice = input("\nEnter choice: ")
             
-            if choice == "1":
-                self.login()
-            elif choice == "2":
-                self.register()
-            elif choice == "3":
-                self.browse_books()
-            elif choice == "4":
-                self.search_books()
-            elif choice == "5":
+            # Look the login state up once; it only changes inside the actions
+            logged_in = is_logged_in()
+            is_admin = logged_in and check_admin()
+            
+            if choice == "5":
                 print("Thank you for using the Online Bookstore Management System!")
                 break
-            elif choice == "6" and self.auth_controller.is_logged_in():
-                self.view_cart()
-            elif choice == "7" and self.auth_controller.is_logged_in():
-                self.checkout()
-            elif choice == "8" and self.auth_controller.is_logged_in():
-                self.view_order_history()
-            elif choice == "9" and self.auth_controller.is_logged_in():
-                self.logout()
-            elif choice == "10" and self.auth_controller.is_admin():
-                self.add_book()
-            elif choice == "11" and self.auth_controller.is_admin():
-                self.update_book()
-            elif choice == "12" and self.auth_controller.is_admin():
-                self.remove_book()
-            elif choice == "13" and self.auth_controller.is_admin():
-                self.view_low_stock()
-            elif choice == "14" and self.auth_controller.is_admin():
-                self.view_inventory_value()
+            
+            action, access = get_action(choice, (None, None))
+            if action is not None and (access is None
+                                       or (access == 'user' and logged_in)
+                                       or (access == 'admin' and is_admin)):
+                action()
             else:
                 print("Invalid choice or insufficient permissions.")